@@ -1,12 +1,30 @@
 import json
-from typing import List, Union
+import math
+from typing import Any, Callable, List, Optional, Union
 
 import requests
-from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
-                      wait_fixed)
+from requests.adapters import HTTPAdapter
+from tenacity import (RetryCallState, retry, retry_if_exception_type,
+                      stop_after_attempt, wait_random_exponential)
 
-from semanticscholar.SemanticScholarException import \
-    BadQueryParametersException, ObjectNotFoundExeception
+from semanticscholar.SemanticScholarException import (
+    BadQueryParametersException, ObjectNotFoundExeception,
+    TooManyRequestsException)
+
+MAX_RETRY_WAIT = 60
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    '''Wait as long as the server asked in Retry-After (between 0 and
+    MAX_RETRY_WAIT seconds), otherwise back off exponentially with random
+    jitter.
+    '''
+    exception = retry_state.outcome.exception()
+    retry_after = getattr(exception, 'retry_after', None)
+    if retry_after is not None:
+        return min(max(retry_after, 0), MAX_RETRY_WAIT)
+    return wait_random_exponential(
+        multiplier=1, max=MAX_RETRY_WAIT)(retry_state)
 
 
 class ApiRequester:
@@ -14,12 +32,37 @@ class ApiRequester:
     This class handles calls to Semantic Scholar API.
     '''
 
+    # Error statuses whose JSON body carries the message, mapped to the
+    # exception to raise and the body key holding the message.
+    _ERRORS = {
+        400: (BadQueryParametersException, 'error'),
+        404: (ObjectNotFoundExeception, 'error'),
+        500: (Exception, 'message'),
+        504: (Exception, 'message')
+    }
+
     def __init__(self, timeout) -> None:
         '''
         :param float timeout: an exception is raised \
             if the server has not issued a response for timeout seconds.
         '''
         self._timeout = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def __enter__(self) -> 'ApiRequester':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Close the underlying HTTP session and release pooled connections.
+        '''
+        self._session.close()
 
     @property
     def timeout(self) -> int:
@@ -36,9 +79,10 @@ class ApiRequester:
         self._timeout = timeout
 
     @retry(
-        wait=wait_fixed(30),
+        wait=wait_retry_after,
         retry=retry_if_exception_type(ConnectionRefusedError),
-        stop=stop_after_attempt(10)
+        stop=stop_after_attempt(6),
+        reraise=True
     )
     def get_data(
                 self,
@@ -60,26 +104,48 @@ class ApiRequester:
         url = f'{url}?{parameters}'
         method = 'POST' if payload else 'GET'
         payload = json.dumps(payload) if payload else None
-        r = requests.request(
+        r = self._session.request(
             method, url, timeout=self._timeout, headers=headers, data=payload)
 
-        data = {}
-        if r.status_code == 200:
-            data = r.json()
+        return self.parse_response(r.status_code, r.json, r.headers)
+
+    @staticmethod
+    def parse_response(
+                status_code: int,
+                body: Callable[[], Any],
+                headers: dict = None
+            ) -> Union[dict, List[dict]]:
+        '''Map an API response to its data or to the matching exception
+
+        :param int status_code: HTTP status code of the response.
+        :param body: callable returning the decoded JSON body.
+        :param dict headers: (optional) response headers.
+        :returns: data or empty :class:`dict` if not found.
+        :rtype: :class:`dict` or :class:`List` of :class:`dict`
+        '''
+
+        if status_code == 200:
+            data = body()
             if len(data) == 1 and 'error' in data:
                 data = {}
-        elif r.status_code == 400:
-            data = r.json()
-            raise BadQueryParametersException(data['error'])
-        elif r.status_code == 403:
+            return data
+        elif status_code == 403:
             raise PermissionError('HTTP status 403 Forbidden.')
-        elif r.status_code == 404:
-            data = r.json()
-            raise ObjectNotFoundExeception(data['error'])
-        elif r.status_code == 429:
-            raise ConnectionRefusedError('HTTP status 429 Too Many Requests.')
-        elif r.status_code in [500, 504]:
-            data = r.json()
-            raise Exception(data['message'])
-
-        return data
+        elif status_code == 429:
+            raise TooManyRequestsException(
+                'HTTP status 429 Too Many Requests.',
+                retry_after=ApiRequester._parse_retry_after(headers))
+        elif status_code in ApiRequester._ERRORS:
+            exception, key = ApiRequester._ERRORS[status_code]
+            raise exception(body()[key])
+
+        return {}
+
+    @staticmethod
+    def _parse_retry_after(headers: dict) -> Optional[float]:
+        retry_after = headers.get('Retry-After') if headers else None
+        try:
+            retry_after = float(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return retry_after if math.isfinite(retry_after) else None
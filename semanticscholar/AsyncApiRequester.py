@@ -0,0 +1,126 @@
+import asyncio
+import json
+from typing import TYPE_CHECKING, List, Union
+
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
+
+from semanticscholar.ApiRequester import ApiRequester, wait_retry_after
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncApiRequester:
+    '''
+    This class handles asynchronous calls to Semantic Scholar API.
+    '''
+
+    _OTHER_LOOP_ERROR = (
+        'The HTTP session was opened in another event loop. Close the client '
+        'in that loop (e.g. with "async with") before using it in a new one.')
+
+    def __init__(self, timeout, concurrency: int = 10) -> None:
+        '''
+        :param float timeout: an exception is raised \
+            if the server has not issued a response for timeout seconds.
+        :param int concurrency: maximum number of requests in flight.
+        '''
+        self._timeout = timeout
+        self._concurrency = concurrency
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+        self._client_timeout = None
+
+    async def __aenter__(self) -> 'AsyncApiRequester':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        '''
+        Close the underlying HTTP session and release pooled connections.
+        '''
+        if self._session is None:
+            return
+        # A session can only be closed from the loop it was opened in. If
+        # that loop has already finished, aiohttp just marks it closed.
+        if self._loop is not asyncio.get_running_loop() and \
+                not self._loop.is_closed():
+            raise RuntimeError(self._OTHER_LOOP_ERROR)
+        await self._session.close()
+        self._session = None
+
+    @property
+    def timeout(self) -> int:
+        '''
+        :type: :class:`int`
+        '''
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: int) -> None:
+        '''
+        :param int timeout:
+        '''
+        self._timeout = timeout
+        self._client_timeout = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # aiohttp sessions and asyncio semaphores are bound to the event loop
+        # they are created in, so both are built on the first request after
+        # the client is opened or closed. Silently replacing a session that
+        # is still open in another loop would leak its connections.
+        # aiohttp itself is imported here to keep it off the import path
+        # of the synchronous client.
+        import aiohttp
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and \
+                self._loop is not loop:
+            raise RuntimeError(self._OTHER_LOOP_ERROR)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._concurrency))
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._loop = loop
+        if self._client_timeout is None:
+            self._client_timeout = aiohttp.ClientTimeout(total=self._timeout)
+        return self._session
+
+    @retry(
+        wait=wait_retry_after,
+        retry=retry_if_exception_type(ConnectionRefusedError),
+        stop=stop_after_attempt(6),
+        reraise=True
+    )
+    async def get_data(
+                self,
+                url: str,
+                parameters: str,
+                headers: dict,
+                payload: dict = None
+            ) -> Union[dict, List[dict]]:
+        '''Get data from Semantic Scholar API
+
+        :param str url: absolute URL to API endpoint.
+        :param str parameters: the parameters to add in the URL.
+        :param str headers: request headers.
+        :param dict payload: data for POST requests.
+        :returns: data or empty :class:`dict` if not found.
+        :rtype: :class:`dict` or :class:`List` of :class:`dict`
+        '''
+
+        url = f'{url}?{parameters}'
+        method = 'POST' if payload else 'GET'
+        payload = json.dumps(payload) if payload else None
+        session = self._get_session()
+
+        async with self._semaphore:
+            async with session.request(
+                    method, url, timeout=self._client_timeout,
+                    headers=headers, data=payload) as r:
+                text = await r.text()
+
+        return ApiRequester.parse_response(
+            r.status, lambda: json.loads(text), r.headers)
@@ -0,0 +1,195 @@
+import asyncio
+from typing import List
+
+from semanticscholar.AsyncApiRequester import AsyncApiRequester
+from semanticscholar.Author import Author
+from semanticscholar.BaseSemanticScholar import BaseSemanticScholar
+from semanticscholar.Paper import Paper
+
+
+class AsyncSemanticScholar(BaseSemanticScholar):
+    '''
+    Asynchronous client to retrieve data from Semantic Scholar Graph API.
+    Lookups can be awaited concurrently, e.g. with :func:`asyncio.gather`,
+    and at most ``concurrency`` requests are sent at the same time.
+    '''
+
+    def __init__(
+                self,
+                timeout: int = 10,
+                api_key: str = None,
+                api_url: str = None,
+                graph_api: bool = True,
+                concurrency: int = 10
+            ) -> None:
+        '''
+        :param float timeout: (optional) an exception is raised\
+            if the server has not issued a response for timeout seconds.
+        :param str api_key: (optional) private API key.
+        :param str api_url: (optional) custom API url.
+        :param bool graph_api: (optional) whether use new Graph API.
+        :param int concurrency: (optional) maximum number of requests\
+            in flight at the same time.
+        '''
+
+        super().__init__(timeout, api_key, api_url, graph_api)
+        self._requester = AsyncApiRequester(self._timeout, concurrency)
+
+    async def __aenter__(self) -> 'AsyncSemanticScholar':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        '''
+        Close the HTTP session used to reach the API.
+        '''
+        await self._requester.close()
+
+    async def _get_batch_data(
+                self,
+                url: str,
+                parameters: str,
+                ids: List[str],
+                batch_size: int
+            ) -> List[dict]:
+        batches = await asyncio.gather(*[
+            self._requester.get_data(
+                url, parameters, self.auth_header, payload)
+            for payload in self._batch_payloads(ids, batch_size)])
+        return [item for batch in batches for item in batch]
+
+    async def get_paper(
+                self,
+                paper_id: str,
+                fields: list = None
+            ) -> Paper:
+        '''Paper lookup
+
+        :calls: `GET /paper/{paper_id} <https://api.semanticscholar.org/\
+            api-docs/graph#tag/Paper-Data/operation/get_graph_get_paper>`_
+
+        :param str paper_id: S2PaperId, CorpusId, DOI, ArXivId, MAG, ACL, \
+               PMID, PMCID, or URL from:
+
+               - semanticscholar.org
+               - arxiv.org
+               - aclweb.org
+               - acm.org
+               - biorxiv.org
+
+        :param list fields: (optional) list of the fields to be returned.
+        :returns: paper data
+        :rtype: :class:`semanticscholar.Paper.Paper`
+        :raises: ObjectNotFoundExeception: if Paper ID not found.
+        '''
+
+        url = f'{self.api_url}/paper/{paper_id}'
+
+        parameters = self._lookup_parameters(fields, self._PAPER_FIELDS)
+
+        data = await self._requester.get_data(
+            url, parameters, self.auth_header)
+        paper = Paper(data)
+
+        return paper
+
+    async def get_papers(
+                self,
+                paper_ids: List[str],
+                fields: list = None
+            ) -> List[Paper]:
+        '''Get details for multiple papers at once
+
+        :calls: `POST /paper/batch <https://api.semanticscholar.org/api-docs/\
+            graph#tag/Paper-Data/operation/post_graph_get_papers>`_
+
+        :param str paper_ids: list of IDs (sent in batches of 500) -\
+            S2PaperId, CorpusId, DOI, ArXivId, MAG, ACL, PMID, PMCID, or URL.
+        :param list fields: (optional) list of the fields to be returned.
+        :returns: papers data, in the order of paper_ids (an empty list,\
+            without calling the API, if paper_ids is empty).
+        :rtype: :class:`List` of :class:`semanticscholar.Paper.Paper`
+        :raises: BadQueryParametersException: if no paper was found.
+        :raises: ObjectNotFoundExeception: if graph_api is False and a\
+            Paper ID is not found (the batch endpoint returns None instead).
+        '''
+
+        if not self._graph_api:
+            fields = fields or Paper.SEARCH_FIELDS
+            return await asyncio.gather(*[
+                self.get_paper(paper_id, fields=fields)
+                for paper_id in paper_ids])
+
+        url = f'{self.api_url}/paper/batch'
+
+        parameters = self._batch_parameters(fields, self._PAPER_SEARCH_FIELDS)
+
+        data = await self._get_batch_data(
+            url, parameters, paper_ids, self.PAPER_BATCH_SIZE)
+        papers = [Paper(item) for item in data]
+
+        return papers
+
+    async def get_author(
+                self,
+                author_id: str,
+                fields: list = None
+            ) -> Author:
+        '''Author lookup
+
+        :calls: `GET /author/{author_id} <https://api.semanticscholar.org/\
+            api-docs/graph#tag/Author-Data/operation/get_graph_get_author>`_
+
+        :param str author_id: S2AuthorId.
+        :returns: author data
+        :rtype: :class:`semanticscholar.Author.Author`
+        :raises: ObjectNotFoundExeception: if Author ID not found.
+        '''
+
+        url = f'{self.api_url}/author/{author_id}'
+
+        parameters = self._lookup_parameters(fields, self._AUTHOR_FIELDS)
+
+        data = await self._requester.get_data(
+            url, parameters, self.auth_header)
+        author = Author(data)
+
+        return author
+
+    async def get_authors(
+                self,
+                author_ids: List[str],
+                fields: list = None
+            ) -> List[Author]:
+        '''Get details for multiple authors at once
+
+        :calls: `POST /author/batch <https://api.semanticscholar.org/api-docs/\
+            graph#tag/Author-Data/operation/get_graph_get_author>`_
+
+        :param str author_ids: list of S2AuthorId (sent in batches of 1000).
+        :returns: author data, in the order of author_ids (an empty list,\
+            without calling the API, if author_ids is empty).
+        :rtype: :class:`List` of :class:`semanticscholar.Author.Author`
+        :raises: BadQueryParametersException: if no author was found.
+        :raises: ObjectNotFoundExeception: if graph_api is False and an\
+            Author ID is not found (the batch endpoint returns None instead).
+        '''
+
+        if not self._graph_api:
+            fields = fields or Author.SEARCH_FIELDS
+            return await asyncio.gather(*[
+                self.get_author(author_id, fields=fields)
+                for author_id in author_ids])
+
+        url = f'{self.api_url}/author/batch'
+
+        parameters = self._batch_parameters(
+            fields, self._AUTHOR_SEARCH_FIELDS)
+
+        data = await self._get_batch_data(
+            url, parameters, author_ids, self.AUTHOR_BATCH_SIZE)
+        authors = [Author(item) for item in data]
+
+        return authors
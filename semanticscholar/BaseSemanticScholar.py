@@ -0,0 +1,90 @@
+import warnings
+from typing import List
+
+from semanticscholar.Author import Author
+from semanticscholar.Paper import Paper
+
+
+class BaseSemanticScholar:
+    '''
+    Base class for both SemanticScholar and AsyncSemanticScholar classes.
+    '''
+
+    DEFAULT_API_URL = 'https://api.semanticscholar.org/graph/v1'
+    DEFAULT_PARTNER_API_URL = 'https://partner.semanticscholar.org/graph/v1'
+
+    PAPER_BATCH_SIZE = 500
+    AUTHOR_BATCH_SIZE = 1000
+
+    # Default ``fields`` query values, joined once instead of on every call.
+    _PAPER_FIELDS = ','.join(sorted(Paper.FIELDS))
+    _AUTHOR_FIELDS = ','.join(sorted(Author.FIELDS))
+    _PAPER_SEARCH_FIELDS = ','.join(Paper.SEARCH_FIELDS)
+    _AUTHOR_SEARCH_FIELDS = ','.join(Author.SEARCH_FIELDS)
+
+    auth_header = {}
+
+    def __init__(
+                self,
+                timeout: int,
+                api_key: str,
+                api_url: str,
+                graph_api: bool
+            ) -> None:
+        '''
+        :param float timeout: an exception is raised\
+            if the server has not issued a response for timeout seconds.
+        :param str api_key: private API key.
+        :param str api_url: custom API url.
+        :param bool graph_api: whether use new Graph API.
+        '''
+
+        if api_url:
+            self.api_url = api_url
+        else:
+            self.api_url = self.DEFAULT_API_URL
+
+        if api_key:
+            self.auth_header = {'x-api-key': api_key}
+            if not api_url:
+                self.api_url = self.DEFAULT_PARTNER_API_URL
+
+        if not graph_api:
+            warnings.warn(
+                'graph_api parameter is deprecated and will be disabled ' +
+                'in the future', DeprecationWarning)
+            self.api_url = self.api_url.replace('/graph', '')
+        self._graph_api = graph_api
+
+        self._timeout = timeout
+
+    @property
+    def timeout(self) -> int:
+        '''
+        :type: :class:`int`
+        '''
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: int) -> None:
+        '''
+        :param int timeout:
+        '''
+        self._timeout = timeout
+        self._requester.timeout = timeout
+
+    @staticmethod
+    def _lookup_parameters(fields: list, default: str) -> str:
+        # Fields are sorted so that equivalent lookups share a cache entry.
+        fields = ','.join(sorted(fields)) if fields else default
+        return f'&fields={fields}'
+
+    @staticmethod
+    def _batch_parameters(fields: list, default: str) -> str:
+        fields = ','.join(fields) if fields else default
+        return f'&fields={fields}'
+
+    @staticmethod
+    def _batch_payloads(ids: List[str], batch_size: int) -> List[dict]:
+        return [{"ids": ids[i:i + batch_size]}
+                for i in range(0, len(ids), batch_size)]
@@ -1,31 +1,30 @@
+import copy
 import warnings
-from typing import List
+from functools import lru_cache, partial
+from typing import List, Union
 
 from semanticscholar.ApiRequester import ApiRequester
 from semanticscholar.Author import Author
 from semanticscholar.BaseReference import BaseReference
+from semanticscholar.BaseSemanticScholar import BaseSemanticScholar
 from semanticscholar.Citation import Citation
 from semanticscholar.PaginatedResults import PaginatedResults
 from semanticscholar.Paper import Paper
 from semanticscholar.Reference import Reference
 
 
-class SemanticScholar:
+class SemanticScholar(BaseSemanticScholar):
     '''
     Main class to retrieve data from Semantic Scholar Graph API
     '''
 
-    DEFAULT_API_URL = 'https://api.semanticscholar.org/graph/v1'
-    DEFAULT_PARTNER_API_URL = 'https://partner.semanticscholar.org/graph/v1'
-
-    auth_header = {}
-
     def __init__(
                 self,
                 timeout: int = 10,
                 api_key: str = None,
                 api_url: str = None,
-                graph_api: bool = True
+                graph_api: bool = True,
+                cache_size: int = 4096
             ) -> None:
         '''
         :param float timeout: (optional) an exception is raised\
@@ -33,41 +32,56 @@ class SemanticScholar:
         :param str api_key: (optional) private API key.
         :param str api_url: (optional) custom API url.
         :param bool graph_api: (optional) whether use new Graph API.
+        :param int cache_size: (optional) maximum number of paper and author\
+            lookups kept in memory (0 disables caching).
         '''
 
-        if api_url:
-            self.api_url = api_url
-        else:
-            self.api_url = self.DEFAULT_API_URL
-
-        if api_key:
-            self.auth_header = {'x-api-key': api_key}
-            if not api_url:
-                self.api_url = self.DEFAULT_PARTNER_API_URL
+        super().__init__(timeout, api_key, api_url, graph_api)
+        self._requester = ApiRequester(self._timeout)
+        # The cache wraps a static function rather than a bound method so it
+        # holds no reference back to this instance.
+        self._get_cached_data = lru_cache(maxsize=cache_size)(
+            partial(self._get_data, self._requester, self.auth_header))
 
-        if not graph_api:
-            warnings.warn(
-                'graph_api parameter is deprecated and will be disabled ' +
-                'in the future', DeprecationWarning)
-            self.api_url = self.api_url.replace('/graph', '')
+    def __enter__(self) -> 'SemanticScholar':
+        return self
 
-        self._timeout = timeout
-        self._requester = ApiRequester(self._timeout)
+    def __exit__(self, *args) -> None:
+        self.close()
 
-    @property
-    def timeout(self) -> int:
+    def close(self) -> None:
         '''
-        :type: :class:`int`
+        Close the HTTP session used to reach the API.
         '''
-        return self._timeout
+        self._requester.close()
 
-    @timeout.setter
-    def timeout(self, timeout: int) -> None:
+    def cache_clear(self) -> None:
         '''
-        :param int timeout:
+        Discard paper and author lookups cached in memory.
         '''
-        self._timeout = timeout
-        self._requester.timeout = timeout
+        self._get_cached_data.cache_clear()
+
+    @staticmethod
+    def _get_data(
+                requester: ApiRequester,
+                headers: dict,
+                url: str,
+                parameters: str
+            ) -> Union[dict, List[dict]]:
+        return requester.get_data(url, parameters, headers)
+
+    def _get_batch_data(
+                self,
+                url: str,
+                parameters: str,
+                ids: List[str],
+                batch_size: int
+            ) -> List[dict]:
+        data = []
+        for payload in self._batch_payloads(ids, batch_size):
+            data += self._requester.get_data(
+                url, parameters, self.auth_header, payload)
+        return data
 
     def get_paper(
                 self,
@@ -97,20 +111,16 @@ class SemanticScholar:
         :raises: ObjectNotFoundExeception: if Paper ID not found.
         '''
 
-        if not fields:
-            fields = Paper.FIELDS
-
         url = f'{self.api_url}/paper/{paper_id}'
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
+        parameters = self._lookup_parameters(fields, self._PAPER_FIELDS)
         if include_unknown_refs:
             warnings.warn(
                 'include_unknown_refs parameter is deprecated and will be disabled ' +
                 'in the future', DeprecationWarning)
             parameters += '&include_unknown_references=true'
 
-        data = self._requester.get_data(url, parameters, self.auth_header)
+        data = copy.deepcopy(self._get_cached_data(url, parameters))
         paper = Paper(data)
 
         return paper
@@ -125,8 +135,9 @@ class SemanticScholar:
         :calls: `POST /paper/batch <https://api.semanticscholar.org/api-docs/\
             graph#tag/Paper-Data/operation/post_graph_get_papers>`_
 
-        :param str paper_ids: list of IDs (must be <= 1000) - S2PaperId,\
-            CorpusId, DOI, ArXivId, MAG, ACL, PMID, PMCID, or URL from:
+        :param str paper_ids: list of IDs (sent in batches of 500) -\
+            S2PaperId, CorpusId, DOI, ArXivId, MAG, ACL, PMID, PMCID, or URL\
+            from:
 
             - semanticscholar.org
             - arxiv.org
@@ -135,23 +146,25 @@ class SemanticScholar:
             - biorxiv.org
 
         :param list fields: (optional) list of the fields to be returned.
-        :returns: papers data
+        :returns: papers data, in the order of paper_ids (an empty list,\
+            without calling the API, if paper_ids is empty).
         :rtype: :class:`List` of :class:`semanticscholar.Paper.Paper`
         :raises: BadQueryParametersException: if no paper was found.
+        :raises: ObjectNotFoundExeception: if graph_api is False and a\
+            Paper ID is not found (the batch endpoint returns None instead).
         '''
 
-        if not fields:
-            fields = Paper.SEARCH_FIELDS
+        if not self._graph_api:
+            fields = fields or Paper.SEARCH_FIELDS
+            return [self.get_paper(paper_id, fields=fields)
+                    for paper_id in paper_ids]
 
         url = f'{self.api_url}/paper/batch'
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
-
-        payload = { "ids": paper_ids }
+        parameters = self._batch_parameters(fields, self._PAPER_SEARCH_FIELDS)
 
-        data = self._requester.get_data(
-            url, parameters, self.auth_header, payload)
+        data = self._get_batch_data(
+            url, parameters, paper_ids, self.PAPER_BATCH_SIZE)
         papers = [Paper(item) for item in data]
 
         return papers
@@ -359,15 +372,11 @@ class SemanticScholar:
         :raises: ObjectNotFoundExeception: if Author ID not found.
         '''
 
-        if not fields:
-            fields = Author.FIELDS
-
         url = f'{self.api_url}/author/{author_id}'
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
+        parameters = self._lookup_parameters(fields, self._AUTHOR_FIELDS)
 
-        data = self._requester.get_data(url, parameters, self.auth_header)
+        data = copy.deepcopy(self._get_cached_data(url, parameters))
         author = Author(data)
 
         return author
@@ -382,24 +391,27 @@ class SemanticScholar:
         :calls: `POST /author/batch <https://api.semanticscholar.org/api-docs/\
             graph#tag/Author-Data/operation/get_graph_get_author>`_
 
-        :param str author_ids: list of S2AuthorId (must be <= 1000).
-        :returns: author data
+        :param str author_ids: list of S2AuthorId (sent in batches of 1000).
+        :returns: author data, in the order of author_ids (an empty list,\
+            without calling the API, if author_ids is empty).
         :rtype: :class:`List` of :class:`semanticscholar.Author.Author`
         :raises: BadQueryParametersException: if no author was found.
+        :raises: ObjectNotFoundExeception: if graph_api is False and an\
+            Author ID is not found (the batch endpoint returns None instead).
         '''
 
-        if not fields:
-            fields = Author.SEARCH_FIELDS
+        if not self._graph_api:
+            fields = fields or Author.SEARCH_FIELDS
+            return [self.get_author(author_id, fields=fields)
+                    for author_id in author_ids]
 
         url = f'{self.api_url}/author/batch'
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
-
-        payload = { "ids": author_ids }
+        parameters = self._batch_parameters(
+            fields, self._AUTHOR_SEARCH_FIELDS)
 
-        data = self._requester.get_data(
-            url, parameters, self.auth_header, payload)
+        data = self._get_batch_data(
+            url, parameters, author_ids, self.AUTHOR_BATCH_SIZE)
         authors = [Author(item) for item in data]
 
         return authors
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class SemanticScholarException(Exception):
     '''A base class for exceptions.'''
 
@@ -11,3 +14,16 @@ class BadQueryParametersException(SemanticScholarException):
 
 class ObjectNotFoundExeception(SemanticScholarException):
     '''Paper or Author ID not found'''
+
+
+class TooManyRequestsException(
+        SemanticScholarException, ConnectionRefusedError):
+    '''HTTP status 429, optionally carrying the Retry-After delay.'''
+
+    def __init__(
+                self,
+                *args: object,
+                retry_after: Optional[float] = None
+            ) -> None:
+        super().__init__(*args)
+        self.retry_after = retry_after
@@ -1 +1,2 @@
+from .AsyncSemanticScholar import AsyncSemanticScholar
 from .SemanticScholar import SemanticScholar
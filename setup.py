@@ -15,7 +15,7 @@ setup(
     license='MIT',
     packages=['semanticscholar'],
     python_requires='>=3.7',
-    install_requires=['requests', 'tenacity'],
+    install_requires=['requests', 'tenacity', 'aiohttp'],
     test_suite='tests',
     tests_require=['vcrpy'],
     classifiers=[
@@ -1,10 +1,18 @@
+import asyncio
+import gc
 import json
+import subprocess
+import sys
 import unittest
+import weakref
 from datetime import datetime
+from unittest import mock
 
 import vcr
 from requests.exceptions import Timeout
 
+from semanticscholar.ApiRequester import ApiRequester, wait_retry_after
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
 from semanticscholar.Author import Author
 from semanticscholar.Citation import Citation
 from semanticscholar.Journal import Journal
@@ -13,7 +21,8 @@ from semanticscholar.PublicationVenue import PublicationVenue
 from semanticscholar.Reference import Reference
 from semanticscholar.SemanticScholar import SemanticScholar
 from semanticscholar.SemanticScholarException import (
-    BadQueryParametersException, ObjectNotFoundExeception)
+    BadQueryParametersException, ObjectNotFoundExeception,
+    TooManyRequestsException)
 from semanticscholar.Tldr import Tldr
 
 test_vcr = vcr.VCR(
@@ -162,6 +171,38 @@ class SemanticScholarTest(unittest.TestCase):
         self.assertEqual(data.raw_data['title'],
                          'Computing Machinery and Intelligence')
 
+    @test_vcr.use_cassette('test_get_paper')
+    def test_get_paper_cached(self):
+        first = self.sch.get_paper('10.1093/mind/lix.236.433')
+        second = self.sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertEqual(first.raw_data, second.raw_data)
+        self.assertIsNot(first.raw_data, second.raw_data)
+        self.sch.cache_clear()
+        self.assertRaises(vcr.errors.CannotOverwriteExistingCassetteException,
+                          self.sch.get_paper,
+                          '10.1093/mind/lix.236.433')
+
+    @test_vcr.use_cassette('test_get_paper')
+    def test_get_paper_cached_copy(self):
+        first = self.sch.get_paper('10.1093/mind/lix.236.433')
+        doi = first.externalIds['DOI']
+        authors = len(first.raw_data['authors'])
+        first.externalIds['DOI'] = 'MUTATED'
+        first.raw_data['authors'].append({'name': 'MUTATED'})
+        second = self.sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertEqual(second.externalIds['DOI'], doi)
+        self.assertEqual(len(second.raw_data['authors']), authors)
+
+    def test_cache_holds_no_reference_cycle(self):
+        gc.disable()
+        try:
+            sch = SemanticScholar()
+            ref = weakref.ref(sch)
+            del sch
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
     @test_vcr.use_cassette
     def test_get_papers(self):
         list_of_paper_ids = [
@@ -174,6 +215,47 @@ class SemanticScholarTest(unittest.TestCase):
                 self.assertIn(
                     'E. Duflo', [author.name for author in item.authors])
 
+    def _mock_batch_requester(self, sch):
+        def get_data(url, parameters, headers, payload=None):
+            if payload is None:
+                return {'paperId': url.rsplit('/', 1)[-1]}
+            return [{'paperId': item} for item in payload['ids']]
+        sch._requester.get_data = mock.Mock(side_effect=get_data)
+
+    def test_get_papers_batches(self):
+        list_of_paper_ids = [str(i) for i in range(1201)]
+        self._mock_batch_requester(self.sch)
+        data = self.sch.get_papers(list_of_paper_ids)
+        calls = self.sch._requester.get_data.call_args_list
+        self.assertEqual(
+            [len(call[0][3]['ids']) for call in calls], [500, 500, 201])
+        self.assertEqual([item.paperId for item in data], list_of_paper_ids)
+
+    def test_get_authors_batches(self):
+        list_of_author_ids = [str(i) for i in range(1201)]
+        self._mock_batch_requester(self.sch)
+        self.sch.get_authors(list_of_author_ids)
+        calls = self.sch._requester.get_data.call_args_list
+        self.assertEqual(
+            [len(call[0][3]['ids']) for call in calls], [1000, 201])
+
+    def test_get_papers_empty(self):
+        self._mock_batch_requester(self.sch)
+        self.assertEqual(self.sch.get_papers([]), [])
+        self.sch._requester.get_data.assert_not_called()
+
+    def test_get_papers_legacy_api(self):
+        with self.assertWarns(DeprecationWarning):
+            sch = SemanticScholar(graph_api=False)
+        self._mock_batch_requester(sch)
+        data = sch.get_papers(['a', 'b'])
+        calls = sch._requester.get_data.call_args_list
+        self.assertEqual(
+            [call[0][0] for call in calls],
+            [f'{sch.api_url}/paper/a', f'{sch.api_url}/paper/b'])
+        self.assertTrue(all(len(call[0]) == 3 for call in calls))
+        self.assertEqual([item.paperId for item in data], ['a', 'b'])
+
     @test_vcr.use_cassette
     def test_get_paper_authors(self):
         data = self.sch.get_paper_authors('CorpusID:54599684')
@@ -210,6 +292,54 @@ class SemanticScholarTest(unittest.TestCase):
                           self.sch.get_paper,
                           '10.1093/mind/lix.236.433')
 
+    @test_vcr.use_cassette('test_get_paper')
+    def test_context_manager(self):
+        with SemanticScholar() as sch:
+            data = sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertEqual(data.title,
+                         'Computing Machinery and Intelligence')
+
+    def test_too_many_requests(self):
+        test_cases = [({'Retry-After': '2'}, 2.0), ({}, None)]
+        for headers, retry_after in test_cases:
+            with self.subTest(headers=headers):
+                with self.assertRaises(TooManyRequestsException) as context:
+                    ApiRequester.parse_response(429, dict, headers)
+                self.assertIsInstance(
+                    context.exception, ConnectionRefusedError)
+                self.assertEqual(context.exception.retry_after, retry_after)
+
+    def test_wait_retry_after(self):
+        test_cases = [(-1, 0), (2.5, 2.5), (7200, 60)]
+        for retry_after, wait in test_cases:
+            with self.subTest(retry_after=retry_after):
+                retry_state = mock.Mock()
+                retry_state.outcome.exception.return_value = \
+                    TooManyRequestsException(retry_after=retry_after)
+                self.assertEqual(wait_retry_after(retry_state), wait)
+
+    def test_retry_on_too_many_requests(self):
+        too_many_requests = mock.Mock(
+            status_code=429, headers={'Retry-After': '0'})
+        ok = mock.Mock(status_code=200, headers={})
+        ok.json.return_value = {'paperId': '1'}
+        requester = ApiRequester(10)
+        requester._session.request = mock.Mock(
+            side_effect=[too_many_requests, ok])
+        data = requester.get_data('url', 'parameters', {})
+        self.assertEqual(data, {'paperId': '1'})
+        self.assertEqual(requester._session.request.call_count, 2)
+
+    def test_retry_attempts_exhausted(self):
+        too_many_requests = mock.Mock(
+            status_code=429, headers={'Retry-After': '0'})
+        requester = ApiRequester(10)
+        requester._session.request = mock.Mock(
+            return_value=too_many_requests)
+        self.assertRaises(TooManyRequestsException,
+                          requester.get_data, 'url', 'parameters', {})
+        self.assertEqual(requester._session.request.call_count, 6)
+
     @test_vcr.use_cassette
     def test_get_author(self):
         data = self.sch.get_author(2262347)
@@ -310,5 +440,98 @@ class SemanticScholarTest(unittest.TestCase):
                     self.assertEqual(str(context.exception), error_message)
 
 
+class AsyncSemanticScholarTest(unittest.TestCase):
+
+    async def _run(self, method, *args, sch=None):
+        async with sch or AsyncSemanticScholar() as client:
+            return await getattr(client, method)(*args)
+
+    def test_aiohttp_not_imported(self):
+        code = 'import sys, semanticscholar; print("aiohttp" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'False')
+
+    @test_vcr.use_cassette('test_get_paper')
+    def test_timeout(self):
+        sch = AsyncSemanticScholar(timeout=5)
+        sch.timeout = 0.01
+        self.assertEqual(sch.timeout, 0.01)
+        self.assertIsNone(sch._requester._client_timeout)
+        asyncio.run(
+            self._run('get_paper', '10.1093/mind/lix.236.433', sch=sch))
+        self.assertEqual(sch._requester._client_timeout.total, 0.01)
+
+    @test_vcr.use_cassette('test_get_paper')
+    def test_get_paper(self):
+        data = asyncio.run(
+            self._run('get_paper', '10.1093/mind/lix.236.433'))
+        self.assertEqual(data.title,
+                         'Computing Machinery and Intelligence')
+
+    @test_vcr.use_cassette('test_get_paper', allow_playback_repeats=True)
+    def test_reuse_across_event_loops(self):
+        sch = AsyncSemanticScholar()
+        for run in range(2):
+            with self.subTest(run=run):
+                data = asyncio.run(self._run(
+                    'get_paper', '10.1093/mind/lix.236.433', sch=sch))
+                self.assertEqual(data.title,
+                                 'Computing Machinery and Intelligence')
+                self.assertIsNone(sch._requester._session)
+
+    @test_vcr.use_cassette('test_get_paper')
+    def test_open_session_in_other_event_loop(self):
+        sch = AsyncSemanticScholar()
+        asyncio.run(sch.get_paper('10.1093/mind/lix.236.433'))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(sch.get_paper('10.1093/mind/lix.236.433'))
+        asyncio.run(sch.close())
+        self.assertIsNone(sch._requester._session)
+
+    @test_vcr.use_cassette('test_get_papers')
+    def test_get_papers(self):
+        list_of_paper_ids = [
+            'CorpusId:470667',
+            '10.2139/ssrn.2250500',
+            '0f40b1f08821e22e859c6050916cec3667778613']
+        data = asyncio.run(self._run('get_papers', list_of_paper_ids))
+        for item in data:
+            with self.subTest(subtest=item.paperId):
+                self.assertIn(
+                    'E. Duflo', [author.name for author in item.authors])
+
+    def test_get_papers_batches(self):
+        async def get_data(url, parameters, headers, payload=None):
+            return [{'paperId': item} for item in payload['ids']]
+        list_of_paper_ids = [str(i) for i in range(1201)]
+        sch = AsyncSemanticScholar()
+        sch._requester.get_data = mock.Mock(side_effect=get_data)
+        data = asyncio.run(sch.get_papers(list_of_paper_ids))
+        calls = sch._requester.get_data.call_args_list
+        self.assertEqual(
+            [len(call[0][3]['ids']) for call in calls], [500, 500, 201])
+        self.assertEqual([item.paperId for item in data], list_of_paper_ids)
+
+    @test_vcr.use_cassette('test_get_author')
+    def test_get_author(self):
+        data = asyncio.run(self._run('get_author', 2262347))
+        self.assertEqual(data.name, 'A. Turing')
+
+    @test_vcr.use_cassette('test_get_authors')
+    def test_get_authors(self):
+        list_of_author_ids = ['3234559', '1726629', '1711844']
+        data = asyncio.run(self._run('get_authors', list_of_author_ids))
+        list_of_author_names = ['E. Dijkstra', 'D. Parnas', 'I. Sommerville']
+        self.assertCountEqual(
+            [item.name for item in data], list_of_author_names)
+
+    @test_vcr.use_cassette('test_not_found')
+    def test_not_found(self):
+        for method in ['get_paper', 'get_author']:
+            with self.subTest(subtest=method):
+                self.assertRaises(ObjectNotFoundExeception,
+                                  asyncio.run, self._run(method, 0))
+
+
 if __name__ == '__main__':
     unittest.main()